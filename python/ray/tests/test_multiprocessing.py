@@ -394,6 +394,8 @@ def test_starmap(pool):
     args = [tuple(range(i)) for i in range(100)]
     assert pool.starmap(f, args) == args
     assert pool.starmap(lambda x, y: x + y, zip([1, 2], [3, 4])) == [4, 6]
+    assert pool.starmap(f, args, chunksize=7) == args
+    assert pool.starmap_async(f, args, chunksize=7).get() == args
 
 
 def test_callbacks(pool_4_processes, pool_4_processes_python_multiprocessing_lib):
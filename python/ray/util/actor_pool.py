@@ -1,3 +1,4 @@
+import collections
 from typing import List, Callable, Any
 
 import ray
@@ -43,7 +44,7 @@ class ActorPool:
         self._next_return_index = 0
 
         # next work depending when actors free
-        self._pending_submits = []
+        self._pending_submits = collections.deque()
 
     def map(self, fn: Callable[[Any], Any], values: List[Any]):
         """Apply the given function in parallel over the actors and values.
@@ -144,9 +145,10 @@ class ActorPool:
             actor = self._idle_actors.pop()
             future = fn(actor, value)
             future_key = tuple(future) if isinstance(future, list) else future
-            self._future_to_actor[future_key] = (self._next_task_index, actor)
-            self._index_to_future[self._next_task_index] = future
-            self._next_task_index += 1
+            index = self._next_task_index
+            self._future_to_actor[future_key] = (index, actor)
+            self._index_to_future[index] = future
+            self._next_task_index = index + 1
         else:
             self._pending_submits.append((fn, value))
 
@@ -190,11 +192,12 @@ class ActorPool:
         """
         if not self.has_next():
             raise StopIteration("No more results to get")
-        if self._next_return_index >= self._next_task_index:
+        index = self._next_return_index
+        if index >= self._next_task_index:
             raise ValueError(
                 "It is not allowed to call get_next() after get_next_unordered()."
             )
-        future = self._index_to_future[self._next_return_index]
+        future = self._index_to_future[index]
         timeout_msg = "Timed out waiting for result"
         raise_timeout_after_ignore = False
         if timeout is not None:
@@ -204,8 +207,8 @@ class ActorPool:
                     raise TimeoutError(timeout_msg)
                 else:
                     raise_timeout_after_ignore = True
-        del self._index_to_future[self._next_return_index]
-        self._next_return_index += 1
+        del self._index_to_future[index]
+        self._next_return_index = index + 1
 
         future_key = tuple(future) if isinstance(future, list) else future
         i, a = self._future_to_actor.pop(future_key)
@@ -267,7 +270,7 @@ class ActorPool:
     def _return_actor(self, actor):
         self._idle_actors.append(actor)
         if self._pending_submits:
-            self.submit(*self._pending_submits.pop(0))
+            self.submit(*self._pending_submits.popleft())
 
     def has_free(self):
         """Returns whether there are any idle actors available.
@@ -5,6 +5,8 @@ from datetime import datetime
 
 from dask.callbacks import Callback
 
+import ray
+
 # The names of the Ray-specific callbacks. These are the kwarg names that
 # RayDaskCallback will accept on construction, and is considered the
 # source-of-truth for what Ray-specific callbacks exist.
@@ -213,63 +215,60 @@ def local_ray_callbacks(callbacks=None):
             RayDaskCallback.ray_active = callbacks
 
 
-class ProgressBarCallback(RayDaskCallback):
+@ray.remote
+class ProgressBarActor:
+    """Actor used by ProgressBarCallback to record task progress."""
+
     def __init__(self):
-        import ray
-
-        @ray.remote
-        class ProgressBarActor:
-            def __init__(self):
-                self._init()
-
-            def submit(self, key, deps, now):
-                for dep in deps.keys():
-                    self.deps[key].add(dep)
-                self.submitted[key] = now
-                self.submission_queue.append((key, now))
-
-            def task_scheduled(self, key, now):
-                self.scheduled[key] = now
-
-            def finish(self, key, now):
-                self.finished[key] = now
-
-            def result(self):
-                return len(self.submitted), len(self.finished)
-
-            def report(self):
-                result = defaultdict(dict)
-                for key, finished in self.finished.items():
-                    submitted = self.submitted[key]
-                    scheduled = self.scheduled[key]
-                    # deps = self.deps[key]
-                    result[key]["execution_time"] = (
-                        finished - scheduled
-                    ).total_seconds()
-                    # Calculate the scheduling time.
-                    # This is inaccurate.
-                    # We should subtract scheduled - (last dep completed).
-                    # But currently it is not easy because
-                    # of how getitem is implemented in dask on ray sort.
-                    result[key]["scheduling_time"] = (
-                        scheduled - submitted
-                    ).total_seconds()
-                result["submission_order"] = self.submission_queue
-                return result
-
-            def ready(self):
-                pass
-
-            def reset(self):
-                self._init()
-
-            def _init(self):
-                self.submission_queue = []
-                self.submitted = defaultdict(None)
-                self.scheduled = defaultdict(None)
-                self.finished = defaultdict(None)
-                self.deps = defaultdict(set)
+        self._init()
+
+    def submit(self, key, deps, now):
+        for dep in deps.keys():
+            self.deps[key].add(dep)
+        self.submitted[key] = now
+        self.submission_queue.append((key, now))
+
+    def task_scheduled(self, key, now):
+        self.scheduled[key] = now
+
+    def finish(self, key, now):
+        self.finished[key] = now
+
+    def result(self):
+        return len(self.submitted), len(self.finished)
+
+    def report(self):
+        result = defaultdict(dict)
+        for key, finished in self.finished.items():
+            submitted = self.submitted[key]
+            scheduled = self.scheduled[key]
+            # deps = self.deps[key]
+            result[key]["execution_time"] = (finished - scheduled).total_seconds()
+            # Calculate the scheduling time.
+            # This is inaccurate.
+            # We should subtract scheduled - (last dep completed).
+            # But currently it is not easy because
+            # of how getitem is implemented in dask on ray sort.
+            result[key]["scheduling_time"] = (scheduled - submitted).total_seconds()
+        result["submission_order"] = self.submission_queue
+        return result
+
+    def ready(self):
+        pass
+
+    def reset(self):
+        self._init()
+
+    def _init(self):
+        self.submission_queue = []
+        self.submitted = defaultdict(None)
+        self.scheduled = defaultdict(None)
+        self.finished = defaultdict(None)
+        self.deps = defaultdict(set)
 
+
+class ProgressBarCallback(RayDaskCallback):
+    def __init__(self):
         try:
             self.pb = ray.get_actor("_dask_on_ray_pb")
             ray.get(self.pb.reset.remote())
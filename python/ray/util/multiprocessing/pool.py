@@ -206,20 +206,22 @@ class ResultThread(threading.Thread):
     ):
         threading.Thread.__init__(self, daemon=True)
         self._got_error = False
-        self._object_refs = []
+        # The initial ObjectRefs are known up front, so size the bookkeeping
+        # in one go instead of growing it per ref with _add_object_ref.
+        self._object_refs = list(object_refs)
         self._num_ready = 0
-        self._results = []
+        self._results = [None] * len(self._object_refs)
         self._ready_index_queue = queue.Queue()
         self._single_result = single_result
         self._callback = callback
         self._error_callback = error_callback
         self._total_object_refs = total_object_refs or len(object_refs)
-        self._indices = {}
+        self._indices = {
+            object_ref: index for index, object_ref in enumerate(self._object_refs)
+        }
         # Thread-safe queue used to add ObjectRefs to fetch after creating
         # this thread (used to lazily submit for imap and imap_unordered).
         self._new_object_refs = queue.Queue()
-        for object_ref in object_refs:
-            self._add_object_ref(object_ref)
 
     def _add_object_ref(self, object_ref):
         self._indices[object_ref] = len(self._object_refs)
@@ -254,27 +256,36 @@ class ResultThread(threading.Thread):
                     # queue.Empty means no result was retrieved if block=False.
                     break
 
-            [ready_id], unready = ray.wait(unready, num_returns=1)
-            try:
-                batch = ray.get(ready_id)
-            except ray.exceptions.RayError as e:
-                batch = [e]
-
-            # The exception callback is called only once on the first result
-            # that errors. If no result errors, it is never called.
-            if not self._got_error:
-                for result in batch:
-                    if isinstance(result, Exception):
-                        self._got_error = True
-                        if self._error_callback is not None:
-                            self._error_callback(result)
-                        break
-                    else:
-                        aggregated_batch_results.append(result)
+            ready_ids, unready = ray.wait(unready, num_returns=1)
+            # Reap every other batch that has already finished in the same
+            # pass instead of issuing one blocking wait per batch.
+            if unready:
+                more_ready_ids, unready = ray.wait(
+                    unready, num_returns=len(unready), timeout=0
+                )
+                ready_ids.extend(more_ready_ids)
 
-            self._num_ready += 1
-            self._results[self._indices[ready_id]] = batch
-            self._ready_index_queue.put(self._indices[ready_id])
+            for ready_id in ready_ids:
+                try:
+                    batch = ray.get(ready_id)
+                except ray.exceptions.RayError as e:
+                    batch = [e]
+
+                # The exception callback is called only once on the first result
+                # that errors. If no result errors, it is never called.
+                if not self._got_error:
+                    for result in batch:
+                        if isinstance(result, Exception):
+                            self._got_error = True
+                            if self._error_callback is not None:
+                                self._error_callback(result)
+                            break
+                        else:
+                            aggregated_batch_results.append(result)
+
+                self._num_ready += 1
+                self._results[self._indices[ready_id]] = batch
+                self._ready_index_queue.put(self._indices[ready_id])
 
         # The regular callback is called only once on the entire List of
         # results as long as none of the results were errors. If any results
@@ -381,7 +392,9 @@ class IMapIterator:
 
     def __init__(self, pool, func, iterable, chunksize=None):
         self._pool = pool
-        self._func = func
+        # Put the function in the object store once so that it isn't
+        # serialized again for every chunk submitted by _submit_next_chunk.
+        self._func = ray.put(func)
         self._next_chunk_index = 0
         self._finished_iterating = False
         # List of bools indicating if the given chunk is ready or not for all
@@ -471,14 +484,15 @@ class OrderedIMapIterator(IMapIterator):
 
             # This loop will break when the next index in order is ready or
             # self._result_thread.next_ready_index() raises a timeout.
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
             index = -1
             while index != self._next_chunk_index:
-                start = time.time()
                 index = self._result_thread.next_ready_index(timeout=timeout)
                 self._submit_next_chunk()
                 self._submitted_chunks[index] = True
                 if timeout is not None:
-                    timeout = max(0, timeout - (time.time() - start))
+                    timeout = max(0, deadline - time.monotonic())
 
             while (
                 self._next_chunk_index < len(self._submitted_chunks)
@@ -785,7 +799,9 @@ class Pool:
                 args = next(iterator)
                 if not unpack_args:
                     args = (args,)
-                chunk.append((args, {}))
+                # run_batch treats missing kwargs as empty, so don't allocate
+                # and serialize an empty dict for every element.
+                chunk.append((args, None))
             except StopIteration:
                 break
 
@@ -801,6 +817,9 @@ class Pool:
         if chunksize is None:
             chunksize = self._calculate_chunksize(iterable)
 
+        # Put the function in the object store once so that it isn't
+        # serialized again for every chunk submitted below.
+        func = ray.put(func)
         iterator = iter(iterable)
         chunk_object_refs = []
         while len(chunk_object_refs) * chunksize < len(iterable):
@@ -898,6 +917,7 @@ class Pool:
         self,
         func: Callable,
         iterable: Iterable,
+        chunksize: Optional[int] = None,
         callback: Callable[[List], None] = None,
         error_callback: Callable[[Exception], None] = None,
     ):
@@ -908,6 +928,7 @@ class Pool:
         return self._map_async(
             func,
             iterable,
+            chunksize=chunksize,
             unpack_args=True,
             callback=callback,
             error_callback=error_callback,